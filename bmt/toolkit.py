@@ -1,10 +1,15 @@
 import logging
+import warnings
 import yaml
 import deprecation
 import requests
-from functools import lru_cache, reduce
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from copy import deepcopy
+from functools import cached_property, lru_cache, partial, wraps
 
-from typing import List, Union, TextIO, Optional, Dict
+from typing import List, Union, TextIO, Optional, Dict, Iterator, Set, FrozenSet, Tuple
 
 from linkml_runtime.linkml_model import PermissibleValueText
 from linkml_runtime.utils.schemaview import SchemaView
@@ -30,11 +35,77 @@ PREDICATE_MAP = f"https://raw.githubusercontent.com/biolink/biolink-model/v{LATE
 NODE_PROPERTY = "node property"
 ASSOCIATION_SLOT = "association slot"
 RELATED_TO = "related to"
+NAMED_THING = "named thing"
 
+# mapping scopes, in decreasing order of specificity
+MAPPING_TYPES = ("exact", "close", "related", "narrow", "broad")
+
+# bound for the memoized methods; their caches are kept on the class and hold a
+# reference to the toolkit, so they must stay bounded for toolkits to be released.
+# Memos that cover the whole model are kept on the toolkit instead (see _ancestors_memo)
 CACHE_SIZE = 1024
 
+# use the libyaml bindings when available, they parse several times faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
+# shared by all toolkits, so that the connections to the model repository are pooled;
+# transient connection failures and server errors are retried with a backoff
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))),
+)
+
+# (connect, read) timeouts in seconds for remote files
+REQUEST_TIMEOUT = (3.05, 30)
+
+
+@lru_cache(maxsize=8)
+def _load_predicate_map(url: str) -> Dict:
+    """
+    Fetch and parse a predicate mapping file, once per url for all toolkits.
+    The parsed mapping is shared, so toolkits work on a copy of it (see ``Toolkit.pmap``).
+    """
+    r = _session.get(url, timeout=REQUEST_TIMEOUT)
+    # an error page must neither be parsed nor cached
+    r.raise_for_status()
+    return yaml.load(r.content, Loader=YAML_LOADER)
+
+
+_warned_deprecations: Set[str] = set()
+
+
+def _deprecated(deprecated_in: str, removed_in: str, details: str = ""):
+    """
+    Mark a method as deprecated.
+
+    Unlike ``deprecation.deprecated``, the warning is only issued on the first call
+    of each deprecated method, so that callers still using the old API in a loop
+    do not pay for a warnings filter scan on every call. The docstring gets the
+    same ``.. deprecated::`` note as with ``deprecation.deprecated``.
+    """
+    note = f".. deprecated:: {deprecated_in}\n   This will be removed in {removed_in}."
+    if details:
+        note = f"{note} {details}"
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if function.__qualname__ not in _warned_deprecations:
+                warnings.warn(
+                    deprecation.DeprecatedWarning(function.__name__, deprecated_in, removed_in, details),
+                    category=DeprecationWarning,
+                    stacklevel=2,
+                )
+                # not before: warn() raises when warnings are turned into errors
+                _warned_deprecations.add(function.__qualname__)
+            return function(*args, **kwargs)
+        wrapper.__doc__ = f"{function.__doc__ or ''}\n\n{note}"
+        return wrapper
+    return decorator
+
 
 class Toolkit(object):
     """
@@ -44,16 +115,60 @@ class Toolkit(object):
     ----------
     schema: Union[str, TextIO, SchemaDefinition]
         The path or url to an instance of the biolink-model.yaml file.
+    predicate_map: str
+        The url of the predicate_mapping.yaml file, only fetched once a predicate mapping is looked up.
+    warm: bool
+        Whether to populate the lookup caches at construction time, so that
+        the first queries do not pay the cost of a cold cache (default: True)
 
     """
 
+    # SchemaView traversals of each kind of element, as (ancestors, descendants)
+    _TRAVERSALS = {
+        ClassDefinition: ("class_ancestors", "class_descendants"),
+        SlotDefinition: ("slot_ancestors", "slot_descendants"),
+    }
+
     def __init__(
             self, schema: Union[Url, Path, TextIO, SchemaDefinition] = REMOTE_PATH,
-            predicate_map: Url = PREDICATE_MAP
+            predicate_map: Url = PREDICATE_MAP,
+            warm: bool = True
     ) -> None:
         self.view = SchemaView(schema)
-        r = requests.get(predicate_map)
-        self.pmap = yaml.safe_load(r.text)
+        self.predicate_map = predicate_map
+        self._pmap = None
+        if warm:
+            self._warm_caches()
+
+    @property
+    def pmap(self) -> Dict:
+        """
+        The predicate mapping, fetched from ``predicate_map`` the first time it is needed.
+        """
+        if self._pmap is None:
+            self._pmap = deepcopy(_load_predicate_map(self.predicate_map))
+        return self._pmap
+
+    @pmap.setter
+    def pmap(self, value: Dict) -> None:
+        self._pmap = value
+        self.__dict__.pop("_predicate_mapping_index", None)
+
+    def _warm_caches(self) -> None:
+        """
+        Populate the caches of the model-wide lookups that most other methods build upon.
+        """
+        # lru_cache keys positional and keyword arguments apart, so warm the
+        # forms that are used: the default internally, the keyword in the docs
+        self.get_all_elements()
+        self.get_all_elements(formatted=True)
+        self._ancestors_closure
+        self._mapping_index
+        self._subset_index
+        self._alias_index
+        self._lower_name_index
+        self._slots_by_domain
+        self._slots_by_range
 
     @lru_cache(CACHE_SIZE)
     def get_all_elements(self, formatted: bool = False) -> List[str]:
@@ -74,10 +189,12 @@ class Toolkit(object):
             A list of elements
 
         """
-        classes = self.get_all_classes(formatted)
-        slots = self.get_all_slots(formatted)
-        types = self.get_all_types(formatted)
-        all_elements = classes + slots + types
+        if formatted:
+            return self._format_all_elements(self.get_all_elements(), formatted)
+        classes = self.get_all_classes()
+        slots = self.get_all_slots()
+        types = self.get_all_types()
+        all_elements = [*classes, *slots, *types]
         return all_elements
 
     @lru_cache(CACHE_SIZE)
@@ -99,11 +216,11 @@ class Toolkit(object):
             A list of elements
 
         """
-        classes = []
-        for x in self.view.schema.classes:
-            classes.append(x)
+        if formatted:
+            return self._format_all_elements(self.get_all_classes(), formatted)
+        classes = list(self.view.schema.classes)
         filtered_classes = self._filter_secondary(classes)
-        return self._format_all_elements(filtered_classes, formatted)
+        return filtered_classes
 
     @lru_cache(CACHE_SIZE)
     def get_all_slots(self, formatted: bool = False) -> List[str]:
@@ -124,11 +241,11 @@ class Toolkit(object):
             A list of elements
 
         """
-        slots = []
-        for x in self.view.schema.slots:
-            slots.append(x)
+        if formatted:
+            return self._format_all_elements(self.get_all_slots(), formatted)
+        slots = list(self.view.schema.slots)
         filtered_slots = self._filter_secondary(slots)
-        return self._format_all_elements(filtered_slots, formatted)
+        return filtered_slots
 
     @lru_cache(CACHE_SIZE)
     def get_all_types(self, formatted: bool = False) -> List[str]:
@@ -149,10 +266,10 @@ class Toolkit(object):
             A list of elements
 
         """
-        types = []
-        for x in self.view.all_types():
-            types.append(x)
-        return self._format_all_elements(types, formatted)
+        if formatted:
+            return self._format_all_elements(self.get_all_types(), formatted)
+        types = list(self.view.all_types())
+        return types
 
     @lru_cache(CACHE_SIZE)
     def get_all_entities(self, formatted: bool = False) -> List[str]:
@@ -228,8 +345,8 @@ class Toolkit(object):
         if field in definition:
             value = definition[field]
             if value:
-                value_set = self.get_descendants(value, formatted=formatted)
-                return any([entry in slot_values for entry in value_set])
+                value_set = self._descendant_set(value, formatted)
+                return not value_set.isdisjoint(slot_values)
         if "description" in definition and definition["description"] is not None:
             # In the case where the target 'field' is missing target details but the definition
             # still has a 'description' field, we deflect responsibility for vetting the slot_values
@@ -282,6 +399,22 @@ class Toolkit(object):
         Optional[SlotDefinition]
             None, if not available.
 
+        """
+        if self._element_index.get(element.name) is element:
+            # elements of the model itself are looked up once per slot
+            return self._get_slot_usage_by_name(element.name, slot)
+        return self._find_slot_usage(element, slot)
+
+    @lru_cache(CACHE_SIZE)
+    def _get_slot_usage_by_name(self, element_name: str, slot: str) -> Optional[SlotDefinition]:
+        """
+        The slot usage of the given slot in the model element with the given name (see ``get_slot_usage``).
+        """
+        return self._find_slot_usage(self._element_index[element_name], slot)
+
+    def _find_slot_usage(self, element: Element, slot: str) -> Optional[SlotDefinition]:
+        """
+        Search the local class, its parent class and its mixins for a slot usage (see ``get_slot_usage``).
         """
         # Check first for local referencing of the slot
         slot_definition: Optional[SlotDefinition] = self.get_local_slot_usage(element, slot)
@@ -446,6 +579,9 @@ class Toolkit(object):
             A list of elements
 
         """
+        if not (subject_categories or predicates or object_categories):
+            # no constraints, so no need to match each association
+            return self.get_all_associations(formatted=formatted)
 
         filtered_elements: List[str] = []
         inverse_predicates: Optional[List[str]] = None
@@ -490,6 +626,7 @@ class Toolkit(object):
                 pred_formatted = format_element(p_elem)
                 predicates_formatted.append(pred_formatted)
 
+        if predicates and match_inverses:
             inverse_predicates = list()
             for pred_curie in predicates_formatted:
                 p_elem = self.get_element(pred_curie)
@@ -499,17 +636,18 @@ class Toolkit(object):
                     continue
                 inverse_p = self.get_inverse(p_elem.name)
                 if inverse_p:
-                    # TODO: unsure that this test is needed, if the
-                    #       existence of 'p_elem' is vetted above, since
-                    #       all predicates in the model ought to have names?
-                    logger.warning(
-                        f"get_associations(): inverse predicate name '{str(p_elem.name)}' " +
-                        f"does not match any element in the current Biolink Model release?"
-                    )
                     inverse_predicates.append(inverse_p)
+                else:
+                    logger.debug("get_associations(): predicate '%s' has no inverse", p_elem.name)
             inverse_predicates = self._format_all_elements(elements=inverse_predicates, formatted=True)
 
         if subject_categories_formatted or predicates_formatted or object_categories_formatted:
+            # the constraints are the same for every association, so build their sets only once
+            subject_category_set = frozenset(subject_categories_formatted)
+            predicate_set = frozenset(predicates_formatted)
+            object_category_set = frozenset(object_categories_formatted)
+            inverse_predicate_set = frozenset(inverse_predicates or ())
+
             # This feels like a bit of a brute force approach as an implementation,
             # but we just use the list of all association names to retrieve each
             # association record for filtering against the constraints?
@@ -536,17 +674,17 @@ class Toolkit(object):
                 if not (
                     self.match_association(
                         association,
-                        subject_categories_formatted,
-                        predicates_formatted,
-                        object_categories_formatted
+                        subject_category_set,
+                        predicate_set,
+                        object_category_set
                     ) or
                     (
                         match_inverses and
                         self.match_association(
                             association,
-                            object_categories,
-                            inverse_predicates,
-                            subject_categories_formatted
+                            object_category_set,
+                            inverse_predicate_set,
+                            subject_category_set
                         )
                     )
                 ):
@@ -579,10 +717,15 @@ class Toolkit(object):
             A list of elements
 
         """
-        elements = self.get_all_slots_with_class_domain("entity")
-        elements += self.get_descendants("node property")
+        if formatted:
+            return self._format_all_elements(self.get_all_node_properties(), formatted)
+        # entity slots may also descend from 'node property', so drop the duplicates
+        elements = list(dict.fromkeys([
+            *self.get_all_slots_with_class_domain("entity"),
+            *self.get_descendants("node property"),
+        ]))
         filtered_elements = self._filter_secondary(elements)
-        return self._format_all_elements(filtered_elements, formatted)
+        return filtered_elements
 
     @lru_cache(CACHE_SIZE)
     def get_all_edge_properties(self, formatted: bool = False) -> List[str]:
@@ -603,10 +746,15 @@ class Toolkit(object):
             A list of elements
 
         """
-        elements = self.get_all_slots_with_class_domain("entity")
-        elements += self.get_descendants("association slot")
+        if formatted:
+            return self._format_all_elements(self.get_all_edge_properties(), formatted)
+        # entity slots may also descend from 'association slot', so drop the duplicates
+        elements = list(dict.fromkeys([
+            *self.get_all_slots_with_class_domain("entity"),
+            *self.get_descendants("association slot"),
+        ]))
         filtered_elements = self._filter_secondary(elements)
-        return self._format_all_elements(filtered_elements, formatted)
+        return filtered_elements
 
     def _filter_secondary(self, elements: List[str]) -> List[str]:
         """
@@ -626,15 +774,18 @@ class Toolkit(object):
             A filtered list of elements
 
         """
-        filtered_elements = []
-        for e in elements:
-            eo = self.view.get_element(e)
-            if isinstance(eo, SlotDefinition):
-                if not eo.alias:
-                    filtered_elements.append(e)
-            else:
-                filtered_elements.append(e)
-        return filtered_elements
+        secondary_slots = self._secondary_slots
+        return [e for e in elements if e not in secondary_slots]
+
+    @cached_property
+    def _secondary_slots(self) -> FrozenSet[str]:
+        """
+        Names of the spurious slots removed by ``_filter_secondary``.
+        """
+        return frozenset(
+            name for name, element in self._element_index.items()
+            if isinstance(element, SlotDefinition) and element.alias
+        )
 
     @lru_cache(CACHE_SIZE)
     def get_permissible_value_ancestors(
@@ -700,7 +851,6 @@ class Toolkit(object):
             return self._format_all_elements(descendants)
         return descendants
 
-    @lru_cache(CACHE_SIZE)
     def get_predicate_mapping(self, mapped_predicate: str) -> Dict[str, str]:
         """
         Get the predicates that map to a given predicate.
@@ -720,13 +870,21 @@ class Toolkit(object):
 
         """
         association = {}
+        for item in self._predicate_mapping_index.get(mapped_predicate, ()):
+            for k, v in item.items():
+                association[format_element(self.get_element(k))] = v
+        return association
 
+    @cached_property
+    def _predicate_mapping_index(self) -> Dict[str, List[Dict]]:
+        """
+        The items of the predicate mapping, keyed by their mapped predicate.
+        """
+        index: Dict[str, List[Dict]] = {}
         for mp in self.pmap.values():
             for item in mp:
-                if item['mapped predicate'] == mapped_predicate:
-                    for k, v in item.items():
-                        association[format_element(self.get_element(k))] = v
-        return association
+                index.setdefault(item['mapped predicate'], []).append(item)
+        return index
 
     @lru_cache(CACHE_SIZE)
     def get_permissible_value_parent(self, permissible_value: str, enum_name: str) -> str:
@@ -794,28 +952,259 @@ class Toolkit(object):
         List[str]
             The names of the given elements ancestors
 
+        """
+        ancs = self._get_ancestors(self._canonical(name), reflexive, mixin)
+        return self._format_all_elements(list(ancs), formatted)
+
+    def _canonical(self, name: str) -> Optional[str]:
+        """
+        The name of the element identified by the given name, CURIE or alias,
+        so that all spellings of an element share the same cache entries.
+        """
+        element = self.get_element(name)
+        return element.name if element is not None else None
+
+    def _get_ancestors(self, name: Optional[str], reflexive: bool, mixin: bool) -> Tuple[str, ...]:
+        """
+        Ancestors of the element with the given canonical name (see ``get_ancestors``).
+        """
+        key = (name, reflexive, mixin)
+        ancestors = self._ancestors_memo.get(key)
+        if ancestors is None:
+            ancestors = self._ancestors_memo[key] = self._traverse(name, True, reflexive, mixin)
+        return ancestors
+
+    @cached_property
+    def _ancestors_memo(self) -> Dict[Tuple[Optional[str], bool, bool], Tuple[str, ...]]:
+        """
+        Memo of ``_get_ancestors``. It is kept on the toolkit rather than in a class-level
+        cache, so that it covers the whole model without evicting the entries of other
+        toolkits, and is released along with the toolkit.
+        """
+        return {}
+
+    def iter_ancestors(
+            self,
+            name: str,
+            reflexive: bool = True,
+            mixin: bool = True,
+    ) -> Iterator[str]:
+        """
+        Lazily yields the names of ancestors.
+
+        Unlike ``get_ancestors``, the hierarchy is walked on demand, so callers
+        that only need a membership test or the first few ancestors can stop early.
+
+        Parameters
+        ----------
+        name: str
+            The name of an element in the Biolink Model
+        reflexive: bool
+            Whether to include the query element in the ancestors
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+
+        Returns
+        -------
+        Iterator[str]
+            The names of the given element's ancestors
+
         """
         element = self.get_element(name)
-        ancs = []
         if isinstance(element, ClassDefinition):
-            ancs = self.view.class_ancestors(element.name, mixins=mixin, reflexive=reflexive)
-        if isinstance(element, SlotDefinition):
-            ancs = self.view.slot_ancestors(element.name, mixins=mixin, reflexive=reflexive)
-            filtered_ancs = self._filter_secondary(ancs)
-        else:
-            filtered_ancs = ancs
-        return self._format_all_elements(filtered_ancs, formatted)
+            parents = partial(self._direct_parents, ClassDefinition)
+            yield from self._iter_closure(element.name, parents, reflexive, mixin)
+        elif isinstance(element, SlotDefinition):
+            parents = partial(self._direct_parents, SlotDefinition)
+            for a in self._iter_closure(element.name, parents, reflexive, mixin):
+                if not self._is_secondary(a):
+                    yield a
+
+    def iter_descendants(
+            self,
+            name: str,
+            reflexive: bool = True,
+            mixin: bool = True,
+    ) -> Iterator[str]:
+        """
+        Lazily yields the names of descendants.
+
+        Unlike ``get_descendants``, the hierarchy is walked on demand, so callers
+        that only need a membership test or the first few descendants can stop early.
+
+        Parameters
+        ----------
+        name: str
+            The name of an element in the Biolink Model
+        reflexive: bool
+            Whether to include the query element in the descendants
+        mixin: bool
+            If True, then that means we want to find mixin descendants as well as is_a descendants
+
+        Returns
+        -------
+        Iterator[str]
+            The names of the given element's descendants
+
+        """
+        element = self.get_element(name)
+        if isinstance(element, ClassDefinition):
+            children = partial(self._direct_children, ClassDefinition)
+            yield from self._iter_closure(element.name, children, reflexive, mixin)
+        elif isinstance(element, SlotDefinition):
+            children = partial(self._direct_children, SlotDefinition)
+            for d in self._iter_closure(element.name, children, reflexive, mixin):
+                if not self._is_secondary(d):
+                    yield d
+
+    @cached_property
+    def _element_index(self) -> Dict[str, Element]:
+        """
+        All elements of the model keyed by name, with the same precedence
+        as ``SchemaView.get_element`` should two kinds of element share a name.
+        """
+        index: Dict[str, Element] = {}
+        for elements in (
+                self.view.all_subsets(),
+                self.view.all_enums(),
+                self.view.all_types(),
+                self.view.all_slots(),
+                self.view.all_classes(),
+        ):
+            index.update(elements)
+        # elements without an explicit URI are identified by their CURIE
+        for element in index.values():
+            if isinstance(element, ClassDefinition) and element.class_uri is None:
+                element.class_uri = format_element(element)
+            elif isinstance(element, SlotDefinition) and element.slot_uri is None:
+                element.slot_uri = format_element(element)
+        return index
+
+    def _hierarchy(self, kind: type) -> Dict[str, Element]:
+        """
+        The definitions of the classes or of the slots, from which both the direct
+        parents and the direct children of ``iter_ancestors``/``iter_descendants`` are read.
+        """
+        return self.view.all_classes() if kind is ClassDefinition else self.view.all_slots()
+
+    def _direct_parents(self, kind: type, name: str, mixins: bool = True) -> Tuple[str, ...]:
+        """
+        Direct is_a parent and mixin parents of the named class or slot.
+        """
+        element = self._hierarchy(kind).get(name)
+        if element is None:
+            return ()
+        parents = (element.is_a,) if element.is_a else ()
+        if mixins and element.mixins:
+            parents = parents + tuple(element.mixins)
+        return parents
+
+    @cached_property
+    def _children_index(self) -> Dict[type, Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]]:
+        """
+        Direct is_a children and mixin children of every class and slot,
+        keyed by element kind and then by parent name.
+        """
+        index = {}
+        for kind in (ClassDefinition, SlotDefinition):
+            elements = self._hierarchy(kind)
+            is_a_children: Dict[str, List[str]] = {}
+            mixin_children: Dict[str, List[str]] = {}
+            for child, element in elements.items():
+                if element.is_a:
+                    is_a_children.setdefault(element.is_a, []).append(child)
+                for mixin in element.mixins or ():
+                    mixin_children.setdefault(mixin, []).append(child)
+            index[kind] = (
+                {parent: tuple(children) for parent, children in is_a_children.items()},
+                {parent: tuple(children) for parent, children in mixin_children.items()},
+            )
+        return index
+
+    def _direct_children(self, kind: type, name: str, mixins: bool = True) -> Tuple[str, ...]:
+        """
+        Direct children of the named class or slot, read from the precomputed children index.
+        """
+        is_a_children, mixin_children = self._children_index[kind]
+        children = is_a_children.get(name, ())
+        if mixins and name in mixin_children:
+            children = children + mixin_children[name]
+        return children
+
+    @cached_property
+    def _ancestors_closure(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Transitive closure of the is_a and mixin hierarchy: the (reflexive) ancestors
+        of every element of the model, keyed by element name.
+        """
+        return {name: frozenset(self._get_ancestors(name, True, True)) for name in self.get_all_elements()}
+
+    def _ancestor_set(self, name: str, mixin: bool = True) -> FrozenSet[str]:
+        """
+        The (reflexive) ancestors of the named element, as a set for membership tests.
+        """
+        element = self.get_element(name)
+        if element is None:
+            return frozenset()
+        if mixin:
+            ancestors = self._ancestors_closure.get(element.name)
+            if ancestors is None:
+                # elements outside of the class and slot hierarchies
+                ancestors = frozenset(self._get_ancestors(element.name, True, True))
+            return ancestors
+        ancestors = self._is_a_ancestor_sets.get(element.name)
+        if ancestors is None:
+            ancestors = self._is_a_ancestor_sets[element.name] = frozenset(
+                self._get_ancestors(element.name, True, False)
+            )
+        return ancestors
+
+    @cached_property
+    def _is_a_ancestor_sets(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Memo of ``_ancestor_set`` without mixins, which ``_ancestors_closure`` does not cover.
+        """
+        return {}
+
+    @lru_cache(CACHE_SIZE)
+    def _descendant_set(self, name: str, formatted: bool = False) -> FrozenSet[str]:
+        """
+        The (reflexive) descendants of the named element, as a set for membership tests.
+        """
+        return frozenset(self.get_descendants(name, formatted=formatted))
+
+    @staticmethod
+    def _iter_closure(name: str, neighbours, reflexive: bool, mixin: bool) -> Iterator[str]:
+        """
+        Iterative depth-first walk of the closure of ``name`` under ``neighbours``,
+        yielding each reachable element name exactly once.
+        """
+        seen = set()
+        stack = deque([name] if reflexive else neighbours(name, mixins=mixin))
+        while stack:
+            n = stack.pop()
+            if n in seen:
+                continue
+            seen.add(n)
+            yield n
+            stack.extend(neighbours(n, mixins=mixin))
+
+    def _is_secondary(self, name: str) -> bool:
+        """
+        Whether a given element is a spurious slot (see ``_filter_secondary``).
+        """
+        return name in self._secondary_slots
 
     def _get_mixin_descendants(self, ancestors: List[ElementName]) -> List[ElementName]:
-        mixins_parents = []
+        mixins_parents = {}
         for ancestor in ancestors:
             a_element = self.get_element(ancestor)
             if a_element.mixins:
                 for mixin in a_element.mixins:
                     mixin_element = self.get_element(mixin)
                     mixin_parents = self.view.ancestors(mixin_element)
-                    mixins_parents = mixins_parents + mixin_parents
-        return mixins_parents
+                    mixins_parents.update(dict.fromkeys(mixin_parents))
+        return list(mixins_parents)
 
     @lru_cache(CACHE_SIZE)
     def get_descendants(
@@ -845,22 +1234,44 @@ class Toolkit(object):
             The names of the given element's descendants
 
         """
-        desc = []
-        filtered_desc = []
-        element = self.get_element(name)
-
-        if element:
-            if isinstance(element, ClassDefinition):
-                desc = self.view.class_descendants(element.name, mixins=mixin, reflexive=reflexive)
-            if isinstance(element, SlotDefinition):
-                desc = self.view.slot_descendants(element.name, mixins=mixin, reflexive=reflexive)
-                filtered_desc = self._filter_secondary(desc)
-            else:
-                filtered_desc = desc
-        else:
+        canonical = self._canonical(name)
+        if canonical is None:
             raise ValueError("not a valid biolink component")
+        desc = self._get_descendants(canonical, reflexive, mixin)
+        return self._format_all_elements(list(desc), formatted)
+
+    def _get_descendants(self, name: str, reflexive: bool, mixin: bool) -> Tuple[str, ...]:
+        """
+        Descendants of the element with the given canonical name (see ``get_descendants``).
+        """
+        key = (name, reflexive, mixin)
+        descendants = self._descendants_memo.get(key)
+        if descendants is None:
+            descendants = self._descendants_memo[key] = self._traverse(name, False, reflexive, mixin)
+        return descendants
+
+    @cached_property
+    def _descendants_memo(self) -> Dict[Tuple[str, bool, bool], Tuple[str, ...]]:
+        """
+        Memo of ``_get_descendants``, kept per toolkit like ``_ancestors_memo``.
+        """
+        return {}
 
-        return self._format_all_elements(filtered_desc, formatted)
+    def _traverse(self, name: Optional[str], ancestors: bool, reflexive: bool, mixin: bool) -> Tuple[str, ...]:
+        """
+        Walk up (ancestors) or down (descendants) the hierarchy of the element with the given
+        canonical name, using the SchemaView traversal registered for its kind in ``_TRAVERSALS``.
+        """
+        element = self._element_index.get(name)
+        traversals = self._TRAVERSALS.get(type(element))
+        if traversals is None:
+            return ()
+        ancestors_method, descendants_method = traversals
+        traverse = getattr(self.view, ancestors_method if ancestors else descendants_method)
+        elements = traverse(element.name, mixins=mixin, reflexive=reflexive)
+        if type(element) is SlotDefinition:
+            elements = self._filter_secondary(elements)
+        return tuple(elements)
 
     @lru_cache(CACHE_SIZE)
     def get_all_multivalued_slots(self) -> List[str]:
@@ -904,9 +1315,13 @@ class Toolkit(object):
         """
         children = []
         element = self.get_element(name)
-        if element:
+        if isinstance(element, ClassDefinition):
+            children = self._direct_children(ClassDefinition, element.name, mixin)
+        elif isinstance(element, SlotDefinition):
+            children = self._direct_children(SlotDefinition, element.name, mixin)
+        elif element:
             children = self.view.get_children(element.name, mixin)
-        return self._format_all_elements(children, formatted)
+        return self._format_all_elements(list(children), formatted)
 
     @lru_cache(CACHE_SIZE)
     def get_parent(self, name: str, formatted: bool = False) -> Optional[str]:
@@ -952,30 +1367,62 @@ class Toolkit(object):
         Element
             The element identified by the given name
 
+        """
+        # fast path for names that are already canonical
+        element = self._element_index.get(name)
+        if element is None:
+            element = self._get_element_by_name_or_alias(name)
+        if element is None and "_" in name:
+            # retry with underscores read as spaces, e.g. 'molecular_function'
+            spaced_name = name.replace("_", " ")
+            element = self._get_element_by_name_or_alias(spaced_name)
+            if element is None:
+                element = self._get_element_by_lowercase_name(spaced_name)
+        if element is None:
+            element = self._get_element_by_lowercase_name(name)
+        return element
+
+    def _get_element_by_name_or_alias(self, name: str) -> Optional[Element]:
+        """
+        Look up an element by its (parsed) name, falling back to the element aliases.
         """
         parsed_name = parse_name(name)
-        logger.debug(parsed_name)
-        element = self.view.get_element(parsed_name)
-        if element is None and self.view.all_aliases() is not None:
+        element = self._element_index.get(parsed_name)
+        if element is None:
             if parsed_name.startswith("biolink:"):
                 parsed_name = parsed_name.replace("biolink:", "")
                 parsed_name = parsed_name.replace("_", " ")
-            for e in self.view.all_aliases():
-                if name in self.view.all_aliases()[e] or parsed_name in self.view.all_aliases()[e]:
-                    element = self.view.get_element(e)
-        if element is None and "_" in name:
-            element = self.get_element(name.replace("_", " "))
-        if element is None:
-            for e, el in self.view.all_elements().items():
-                if el.name.lower() == name.lower():
-                    element = el
-
-        if type(element) == ClassDefinition and element.class_uri is None:
-            element.class_uri = format_element(element)
-        if type(element) == SlotDefinition and element.slot_uri is None:
-            element.slot_uri = format_element(element)
+            # when several elements share an alias, the last one declared wins
+            matches = [self._alias_index[a] for a in (name, parsed_name) if a in self._alias_index]
+            if matches:
+                element = self._element_index.get(max(matches)[1])
         return element
 
+    def _get_element_by_lowercase_name(self, name: str) -> Optional[Element]:
+        """
+        Look up an element by a case-insensitive match on its name.
+        """
+        return self._lower_name_index.get(name.lower())
+
+    @cached_property
+    def _alias_index(self) -> Dict[str, Tuple[int, str]]:
+        """
+        The name of the element declaring each alias, along with the position
+        of that element in the model (see ``_get_element_by_name_or_alias``).
+        """
+        index = {}
+        for position, (element_name, aliases) in enumerate((self.view.all_aliases() or {}).items()):
+            for alias in aliases:
+                index[alias] = (position, element_name)
+        return index
+
+    @cached_property
+    def _lower_name_index(self) -> Dict[str, Element]:
+        """
+        All elements of the model keyed by their lowercased name.
+        """
+        return {el.name.lower(): el for el in self.view.all_elements().values()}
+
     def get_slot_domain(
             self,
             slot_name,
@@ -1004,7 +1451,6 @@ class Toolkit(object):
 
         """
         slot_domain = []
-        slot_domain_desc = []
         element = self.get_element(slot_name)
         if element:
             if element.domain:
@@ -1015,10 +1461,7 @@ class Toolkit(object):
                         tk_element = self.get_element(element)
                         if tk_element and tk_element.domain:
                             slot_domain.append(tk_element.domain)
-            if slot_domain:
-                for domain in slot_domain:
-                    slot_domain_desc = self.get_descendants(domain, reflexive=True, mixin=mixin)
-                slot_domain.extend(slot_domain_desc)
+            slot_domain = self._with_descendants(slot_domain, mixin)
         return self._format_all_elements(slot_domain, formatted)
 
     def get_slot_range(
@@ -1050,7 +1493,6 @@ class Toolkit(object):
 
         """
         slot_range = []
-        slot_range_desc = []
         element = self.get_element(slot_name)
         if element:
             if element.range:
@@ -1061,12 +1503,18 @@ class Toolkit(object):
                         tk_element = self.get_element(element)
                         if tk_element and tk_element.range:
                             slot_range.append(tk_element.range)
-            if slot_range:
-                for range in slot_range:
-                    slot_range_desc = self.get_descendants(range, reflexive=True, mixin=mixin)
-                slot_range.extend(slot_range_desc)
+            slot_range = self._with_descendants(slot_range, mixin)
         return self._format_all_elements(slot_range, formatted)
 
+    def _with_descendants(self, class_names: List[str], mixin: bool) -> List[str]:
+        """
+        The given classes followed by all of their descendants, without duplicates.
+        """
+        classes = dict.fromkeys(class_names)
+        for class_name in class_names:
+            classes.update(dict.fromkeys(self.get_descendants(class_name, reflexive=True, mixin=mixin)))
+        return list(classes)
+
     def validate_edge(self, subject: str, predicate: str, p_object: str, ancestors: bool = True) -> bool:
         """
         Validates an edge.
@@ -1089,8 +1537,7 @@ class Toolkit(object):
 
         """
         if self.is_predicate(predicate):
-            predicate_domains = self.get_slot_domain(predicate, include_ancestors=True, mixin=True, formatted=True)
-            predicate_ranges = self.get_slot_range(predicate, include_ancestors=True, mixin=True, formatted=True)
+            predicate_domains, predicate_ranges = self._predicate_domain_range(predicate)
 
             if subject in predicate_domains and p_object in predicate_ranges:
                 return True
@@ -1103,18 +1550,13 @@ class Toolkit(object):
                     object_ancestors = self.get_ancestors(object_entity.name, formatted=True, mixin=True)
                     # this is kind of hacky, the issue is that mixins don't descend from any shared class
                     # like NamedThing.
+                    # the ancestor lists are shared with the cache of get_ancestors, so extend copies
                     if self.is_mixin(subject_entity.name):
-                        subject_ancestors.append("biolink:NamedThing")
+                        subject_ancestors = [*subject_ancestors, "biolink:NamedThing"]
                     if self.is_mixin(object_entity.name):
-                        object_ancestors.append("biolink:NamedThing")
-                    subject_in_domain = False
-                    object_in_range = False
-                    for subject_ancestor in subject_ancestors:
-                        if subject_ancestor in predicate_domains:
-                            subject_in_domain = True
-                    for object_ancestor in object_ancestors:
-                        if object_ancestor in predicate_ranges:
-                            object_in_range = True
+                        object_ancestors = [*object_ancestors, "biolink:NamedThing"]
+                    subject_in_domain = not predicate_domains.isdisjoint(subject_ancestors)
+                    object_in_range = not predicate_ranges.isdisjoint(object_ancestors)
                     if subject_in_domain and object_in_range:
                         return True
                 else:
@@ -1122,6 +1564,16 @@ class Toolkit(object):
 
         return False
 
+    @lru_cache(CACHE_SIZE)
+    def _predicate_domain_range(self, predicate: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        The formatted domain and range classes of a predicate, including their descendants.
+        """
+        return (
+            frozenset(self.get_slot_domain(predicate, include_ancestors=True, mixin=True, formatted=True)),
+            frozenset(self.get_slot_range(predicate, include_ancestors=True, mixin=True, formatted=True)),
+        )
+
     def is_subproperty_of(self, predicate: str, name: str, formatted: bool = False) -> bool:
         """
         Checks if a given name is a 'subproperty_of' a given predicate.
@@ -1301,15 +1753,9 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
-        element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_domain(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
+        filtered_slots = self._get_slots_with_class(
+            class_name, check_ancestors, mixin, domain=True, predicates=True
+        )
         return self._format_all_elements(filtered_slots, formatted)
 
     def get_all_predicates_with_class_range(
@@ -1339,15 +1785,9 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
-        element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_range(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
+        filtered_slots = self._get_slots_with_class(
+            class_name, check_ancestors, mixin, domain=False, predicates=True
+        )
         return self._format_all_elements(filtered_slots, formatted)
 
     def get_all_properties_with_class_domain(
@@ -1377,15 +1817,9 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
-        element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_domain(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO not in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
+        filtered_slots = self._get_slots_with_class(
+            class_name, check_ancestors, mixin, domain=True, predicates=False
+        )
         return self._format_all_elements(filtered_slots, formatted)
 
     def get_all_properties_with_class_range(
@@ -1415,17 +1849,49 @@ class Toolkit(object):
             A list of slots
 
         """
-        filtered_slots = []
-        element = self.get_element(class_name)
-        if element:
-            slots = self._get_all_slots_with_class_range(
-                element, check_ancestors, mixin
-            )
-            for s in slots:
-                if not s.alias and RELATED_TO not in self.get_ancestors(s.name, mixin):
-                    filtered_slots.append(s.name)
+        filtered_slots = self._get_slots_with_class(
+            class_name, check_ancestors, mixin, domain=False, predicates=False
+        )
         return self._format_all_elements(filtered_slots, formatted)
 
+    def _get_slots_with_class(
+            self, class_name: str, check_ancestors: bool, mixin: bool, domain: bool, predicates: bool
+    ) -> List[str]:
+        """
+        The (non-alias) slots having the given class as their domain or range,
+        restricted to either predicates or properties.
+
+        Parameters
+        ----------
+        class_name: str
+            The name or alias of a class in the Biolink Model
+        check_ancestors: bool
+            Whether or not to lookup slots that include ancestors of the given class
+        mixin: bool
+            If True, then that means we want to find mixin ancestors as well as is_a ancestors
+        domain: bool
+            Whether to look up slots by their domain (True) or by their range (False)
+        predicates: bool
+            Whether to keep the predicates (True) or the properties (False)
+
+        Returns
+        -------
+        List[str]
+            A list of slot names
+
+        """
+        element = self.get_element(class_name)
+        if not element:
+            return []
+        if domain:
+            slots = self._get_all_slots_with_class_domain(element, check_ancestors, mixin)
+        else:
+            slots = self._get_all_slots_with_class_range(element, check_ancestors, mixin)
+        return [
+            s.name for s in slots
+            if not s.alias and (RELATED_TO in self._ancestor_set(s.name, mixin)) == predicates
+        ]
+
     def get_value_type_for_slot(self, slot_name, formatted: bool = False) -> str:
         """
         Get the value type for a given slot.
@@ -1446,11 +1912,10 @@ class Toolkit(object):
         element_type = None
         element = self.get_element(slot_name)
         if element:
-            types = self.get_all_types()
-            if element.range is None and self.view.schema.default_range:
-                element.range = self.view.schema.default_range
-            if element.range in types:
-                et = element.range
+            # fall back to the default range without writing it into the shared slot definition
+            slot_range = element.range or self.view.schema.default_range
+            if slot_range in self._type_names:
+                et = slot_range
             else:
                 et = "uriorcurie"
             if formatted:
@@ -1459,6 +1924,13 @@ class Toolkit(object):
                 element_type = et
         return element_type
 
+    @cached_property
+    def _type_names(self) -> FrozenSet[str]:
+        """
+        Names of all the types of the model, for constant time membership tests.
+        """
+        return frozenset(self.view.all_types())
+
     def _get_all_slots_with_class_domain(
             self, element: Element, check_ancestors: bool, mixin: bool = True
     ) -> List[Element]:
@@ -1480,17 +1952,7 @@ class Toolkit(object):
             A list of slots
 
         """
-        slots = []
-        for k, v in self.view.schema.slots.items():
-            if check_ancestors:
-                if (v.domain == element.name or v.domain in self.get_ancestors(element.name, mixin)
-                        or element.name in v.domain_of
-                        or any(v.domain_of) in self.get_ancestors(element.name, mixin)):
-                    slots.append(v)
-            else:
-                if element.name == v.domain or element.name in v.domain_of:
-                    slots.append(v)
-        return slots
+        return self._get_slots_by_class(self._slots_by_domain, element, check_ancestors, mixin)
 
     def _get_all_slots_with_class_range(
             self, element: Element, check_ancestors: bool, mixin: bool = True
@@ -1513,17 +1975,50 @@ class Toolkit(object):
             A list of slots
 
         """
-        slots = []
-        for k, v in self.view.schema.slots.items():
-            if check_ancestors:
-                if v.range == element.name or v.range in self.get_ancestors(
-                        element.name, mixin
-                ):
-                    slots.append(v)
-            else:
-                if v.range and element.name == v.range:
-                    slots.append(v)
-        return slots
+        return self._get_slots_by_class(self._slots_by_range, element, check_ancestors, mixin)
+
+    def _get_slots_by_class(
+            self, index: Dict[str, List[SlotDefinition]], element: Element, check_ancestors: bool, mixin: bool
+    ) -> List[Element]:
+        """
+        Read the slots of the given class, and optionally of its ancestors, from a
+        ``_slots_by_domain`` or ``_slots_by_range`` index.
+        """
+        if not check_ancestors:
+            return list(index.get(element.name, ()))
+        slots = {}
+        for class_name in [element.name, *self.get_ancestors(element.name, mixin=mixin)]:
+            for slot in index.get(class_name, ()):
+                slots.setdefault(slot.name, slot)
+        return list(slots.values())
+
+    @cached_property
+    def _slots_by_domain(self) -> Dict[str, List[SlotDefinition]]:
+        """
+        The slots of the schema keyed by the name of each of their domain classes,
+        be it their ``domain`` or one of their ``domain_of`` classes.
+
+        This is a snapshot of the slot definitions, taken at warm-up (or on first use);
+        call ``clear_caches`` after modifying them.
+        """
+        index: Dict[str, List[SlotDefinition]] = {}
+        for slot in self.view.schema.slots.values():
+            for class_name in dict.fromkeys([slot.domain, *(slot.domain_of or ())]):
+                if class_name:
+                    index.setdefault(class_name, []).append(slot)
+        return index
+
+    @cached_property
+    def _slots_by_range(self) -> Dict[str, List[SlotDefinition]]:
+        """
+        The slots of the schema keyed by the name of their range, snapshotted
+        like ``_slots_by_domain``.
+        """
+        index: Dict[str, List[SlotDefinition]] = {}
+        for slot in self.view.schema.slots.values():
+            if slot.range:
+                index.setdefault(slot.range, []).append(slot)
+        return index
 
     @lru_cache(CACHE_SIZE)
     def is_node_property(self, name: str, mixin: bool = True) -> bool:
@@ -1544,7 +2039,7 @@ class Toolkit(object):
         bool
             That the named element is a valid node property in Biolink Model
         """
-        return NODE_PROPERTY in self.get_ancestors(name, mixin)
+        return NODE_PROPERTY in self._ancestor_set(name, mixin)
 
     @lru_cache(CACHE_SIZE)
     def is_association_slot(self, name: str, mixin: bool = True) -> bool:
@@ -1565,7 +2060,7 @@ class Toolkit(object):
         bool
             That the named element is a valid an association slot in Biolink Model
         """
-        return ASSOCIATION_SLOT in self.get_ancestors(name, mixin)
+        return ASSOCIATION_SLOT in self._ancestor_set(name, mixin)
 
     @lru_cache(CACHE_SIZE)
     def is_predicate(self, name: str, mixin: bool = True) -> bool:
@@ -1586,7 +2081,7 @@ class Toolkit(object):
         bool
             That the named element is a valid relation/predicate in Biolink Model
         """
-        return RELATED_TO in self.get_ancestors(name, mixin)
+        return RELATED_TO in self._ancestor_set(name, mixin)
 
     @lru_cache(CACHE_SIZE)
     def get_denormalized_association_slots(self, formatted) -> List[Element]:
@@ -1628,19 +2123,18 @@ class Toolkit(object):
             That the named element is a valid translator canonical prediacte in Biolink Model
         """
         element = self.get_element(name)
-        annotation_tags = []
-        if element:
-            for annotation in element.annotations:
-                annotation_tags.append(annotation)
-        is_canonical = (
-            True
-            if element is not None and "canonical_predicate" in annotation_tags
-            else False
-        )
-        return (
-            True
-            if RELATED_TO in self.get_ancestors(name, mixin) and is_canonical
-            else False
+        if element is None or element.name not in self._canonical_predicates:
+            return False
+        return RELATED_TO in self._ancestor_set(name, mixin)
+
+    @cached_property
+    def _canonical_predicates(self) -> FrozenSet[str]:
+        """
+        Names of the elements annotated as ``canonical_predicate``.
+        """
+        return frozenset(
+            name for name, element in self._element_index.items()
+            if "canonical_predicate" in (getattr(element, "annotations", None) or ())
         )
 
     @lru_cache(CACHE_SIZE)
@@ -1762,9 +2256,18 @@ class Toolkit(object):
             That the named element is part of a given subset in Biolink Model
 
         """
-        parsed_name = parse_name(name)
-        element = self.view.get_element(parsed_name)
-        return subset in element.in_subset
+        return parse_name(name) in self._subset_index.get(subset, ())
+
+    @cached_property
+    def _subset_index(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Index of the names of the elements in each subset of the model, keyed by subset name.
+        """
+        index: Dict[str, Set[str]] = {}
+        for name, element in self.view.all_elements().items():
+            for subset in getattr(element, "in_subset", None) or ():
+                index.setdefault(str(subset), set()).add(name)
+        return {subset: frozenset(names) for subset, names in index.items()}
 
     @lru_cache(CACHE_SIZE)
     def is_category(self, name: str, mixin: bool = True) -> bool:
@@ -1785,7 +2288,7 @@ class Toolkit(object):
         bool
             That the named element is a valid category in Biolink Model
         """
-        return "named thing" in self.get_ancestors(name, mixin)
+        return NAMED_THING in self._ancestor_set(name, mixin)
 
     @lru_cache(CACHE_SIZE)
     def is_qualifier(self, name: str) -> bool:
@@ -1802,8 +2305,8 @@ class Toolkit(object):
         bool
             That the named element is a valid edge qualifier in the Biolink Model
         """
-
-        if self.view.get_slot(parse_name(name)) and "qualifier" in self.view.slot_ancestors(parse_name(name)):
+        parsed_name = parse_name(name)
+        if self.view.get_slot(parsed_name) and "qualifier" in self._ancestor_set(parsed_name):
             return True
         else:
             return False
@@ -1823,10 +2326,8 @@ class Toolkit(object):
         bool
             That the named element is a valid enum in the Biolink Model
         """
-        if ":" in name:
-            enum = self.view.get_enum(name.split(":")[1])
-        else:
-            enum = self.view.get_enum(name)
+        _, sep, local_name = name.partition(":")
+        enum = self.view.get_enum(local_name if sep else name)
         if not enum:
             return False
         return True
@@ -1850,8 +2351,9 @@ class Toolkit(object):
             That the named element is in the set of 'permissible values' of the Enum
         """
 
-        if ":" in enum_name:
-            enum = self.view.get_enum(enum_name.split(":")[1])
+        _, sep, local_name = enum_name.partition(":")
+        if sep:
+            enum = self.view.get_enum(local_name)
         else:
             enum = self.view.get_enum(enum_name, strict=True)
         if enum and value in enum.permissible_values:
@@ -1883,16 +2385,24 @@ class Toolkit(object):
         if ":" in identifier:
             id_components = identifier.split(":")
             prefix = id_components[0]
-            elements = self.get_all_elements()
-            for category in elements:
-                element = self.get_element(category)
-                if hasattr(element, 'id_prefixes') and prefix in element.id_prefixes:
-                    categories.append(element.name)
+            categories = list(self._elements_by_prefix.get(prefix, ()))
         if len(categories) == 0:
             logger.warning("no biolink class found for the given curie: %s, try get_element_by_mapping?", identifier)
 
         return categories
 
+    @cached_property
+    def _elements_by_prefix(self) -> Dict[str, List[str]]:
+        """
+        The names of the elements declaring each id prefix (see ``get_element_by_prefix``).
+        """
+        index: Dict[str, List[str]] = {}
+        for category in self.get_all_elements():
+            element = self.get_element(category)
+            for prefix in dict.fromkeys(getattr(element, "id_prefixes", None) or ()):
+                index.setdefault(prefix, []).append(element.name)
+        return index
+
     @lru_cache(CACHE_SIZE)
     def get_element_by_mapping(
             self,
@@ -1928,30 +2438,29 @@ class Toolkit(object):
         else:
             mappings = self.get_all_elements_by_mapping(identifier)
         if mappings:
-            ancestors: List[List[str]] = []
+            mapping_set = frozenset(mappings)
+            first_mapping = None
+            ancestors: List[FrozenSet[str]] = []
             for m in mappings:
-                ancestors.append(
-                    [x for x in self.get_ancestors(m, mixin)[::-1] if x in mappings]
-                )
-                logger.debug(ancestors)
-            without_empty_lists = list(filter(None, ancestors))
-            common_ancestors = reduce(
-                lambda s, l: s.intersection(set(l)), without_empty_lists[1:], set(without_empty_lists[0])
-            )
-            logger.debug("common_ancestors")
-            logger.debug(common_ancestors)
-            for a in without_empty_lists[0]:
-                logger.debug("ancestors[0]")
-                logger.debug(a)
+                mapped_ancestors = self._ancestor_set(m, mixin) & mapping_set
+                if mapped_ancestors:
+                    if first_mapping is None:
+                        first_mapping = m
+                    ancestors.append(mapped_ancestors)
+            if not ancestors:
+                return None
+            common_ancestors = frozenset.intersection(*ancestors)
+            logger.debug("mapped ancestors: %s, common ancestors: %s", ancestors, common_ancestors)
+            for a in reversed(self.get_ancestors(first_mapping, mixin=mixin)):
                 if a in common_ancestors:
                     if formatted:
-                        element = format_element(self.view.get_element(a))
+                        element = format_element(self._element_index[a])
                     else:
                         element = a
                     return element
 
     @lru_cache(CACHE_SIZE)
-    def _get_element_by_mapping(self, identifier: str) -> List[str]:
+    def _get_element_by_mapping(self, identifier: str) -> FrozenSet[str]:
         """
         Get the most specific mapping corresponding to a given identifier.
         This method first checks for general mappings. If it can't find any then
@@ -1966,29 +2475,26 @@ class Toolkit(object):
 
         Returns
         -------
-        List[str]
-            A list of Biolink elements that correspond to the given identifier IRI/CURIE
+        FrozenSet[str]
+            The Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = set(self.view.get_element_by_mapping(identifier))
-        if not mappings:
-            exact = set(self.get_element_by_exact_mapping(identifier))
-            mappings.update(exact)
-        if not mappings:
-            close = set(self.get_element_by_close_mapping(identifier))
-            mappings.update(close)
-        if not mappings:
-            related = set(self.get_element_by_related_mapping(identifier))
-            mappings.update(related)
-        if not mappings:
-            narrow = set(self.get_element_by_narrow_mapping(identifier))
-            mappings.update(narrow)
+        mappings = self._get_mapped_elements(identifier)
         if not mappings:
-            broad = set(self.get_element_by_broad_mapping(identifier))
-            mappings.update(broad)
-        return mappings
+            scoped_mappings = self._mapping_index.get(identifier, {})
+            for mapping_type in MAPPING_TYPES:
+                mappings = scoped_mappings.get(mapping_type)
+                if mappings:
+                    break
+        return frozenset(mappings or ())
+
+    def _get_element_by_mapping_type(self, identifier: str, mapping_type: str, formatted: bool) -> List[str]:
+        """
+        The elements mapped to the given identifier with the given type of mapping (one of ``MAPPING_TYPES``).
+        """
+        elements = self._mapping_index.get(identifier, {}).get(mapping_type, ())
+        return self._format_all_elements(list(elements), formatted)
 
-    @lru_cache(CACHE_SIZE)
     def get_element_by_exact_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -2009,19 +2515,8 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mapping_index = self.view.get_mapping_index()
-        elements = self.view.get_element_by_mapping(identifier)
-        if elements:
-            for element in elements:
-                if mapping_index.get(identifier)[0] == 'exact' and mapping_index.get(identifier)[1] == element:
-                    formatted_element = format_element(element)
-                    return [formatted_element]
-                else:
-                    return []
-        else:
-            return []
+        return self._get_element_by_mapping_type(identifier, "exact", formatted)
 
-    @lru_cache(CACHE_SIZE)
     def get_element_by_close_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -2042,19 +2537,8 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mapping_index = self.view.get_mapping_index()
-        elements = self.view.get_element_by_mapping(identifier)
-        if elements:
-            for element in elements:
-                if mapping_index.get(identifier)[0] == 'close' and mapping_index.get(identifier)[1] == element:
-                    formatted_element = format_element(element)
-                    return [formatted_element]
-                else:
-                    return []
-        else:
-            return []
+        return self._get_element_by_mapping_type(identifier, "close", formatted)
 
-    @lru_cache(CACHE_SIZE)
     def get_element_by_related_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -2075,19 +2559,8 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mapping_index = self.view.get_mapping_index()
-        elements = self.view.get_element_by_mapping(identifier)
-        if elements:
-            for element in elements:
-                if mapping_index.get(identifier)[0] == 'related' and mapping_index.get(identifier)[1] == element:
-                    formatted_element = format_element(element)
-                    return [formatted_element]
-                else:
-                    return []
-        else:
-            return []
+        return self._get_element_by_mapping_type(identifier, "related", formatted)
 
-    @lru_cache(CACHE_SIZE)
     def get_element_by_narrow_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -2108,19 +2581,8 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mapping_index = self.view.get_mapping_index()
-        elements = self.view.get_element_by_mapping(identifier)
-        if elements:
-            for element in elements:
-                if mapping_index.get(identifier)[0] == 'narrow' and mapping_index.get(identifier)[1] == element:
-                    formatted_element = format_element(element)
-                    return [formatted_element]
-                else:
-                    return []
-        else:
-            return []
+        return self._get_element_by_mapping_type(identifier, "narrow", formatted)
 
-    @lru_cache(CACHE_SIZE)
     def get_element_by_broad_mapping(
             self, identifier: str, formatted: bool = False
     ) -> List[str]:
@@ -2141,17 +2603,21 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mapping_index = self.view.get_mapping_index()
-        elements = self.view.get_element_by_mapping(identifier)
-        if elements:
-            for element in elements:
-                if mapping_index.get(identifier)[0] == 'broad' and mapping_index.get(identifier)[1] == element:
-                    formatted_element = format_element(element)
-                    return [formatted_element]
-                else:
-                    return []
-        else:
-            return []
+        return self._get_element_by_mapping_type(identifier, "broad", formatted)
+
+    @cached_property
+    def _mapping_index(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Index of the names of all Biolink elements by the identifiers they map to,
+        grouped by mapping type (e.g. ``exact``, ``close``, ``related``, ``narrow``, ``broad``).
+        """
+        index: Dict[str, Dict[str, List[str]]] = {}
+        for identifier, mappings in self.view.get_mapping_index().items():
+            for mapping_type, element in mappings:
+                names = index.setdefault(identifier, {}).setdefault(mapping_type, [])
+                if element.name not in names:
+                    names.append(element.name)
+        return index
 
     @lru_cache(CACHE_SIZE)
     def get_all_elements_by_mapping(
@@ -2174,9 +2640,30 @@ class Toolkit(object):
             A list of Biolink elements that correspond to the given identifier IRI/CURIE
 
         """
-        mappings = self.view.get_element_by_mapping(identifier)
+        mappings = list(self._get_mapped_elements(identifier))
         return self._format_all_elements(mappings, formatted)
 
+    @lru_cache(CACHE_SIZE)
+    def _get_mapped_elements(self, identifier: str) -> Tuple[str, ...]:
+        """
+        Get the names of all Biolink elements that have the given identifier among their mappings.
+
+        The SchemaView lookup walks every element of the model, so it is done once per
+        identifier here and shared by all of the mapping getters.
+
+        Parameters
+        ----------
+        identifier: str
+            The identifier as an IRI or CURIE
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The Biolink elements that correspond to the given identifier IRI/CURIE
+
+        """
+        return tuple(self.view.get_element_by_mapping(identifier))
+
     def _format_all_elements(
             self, elements: List[str], formatted: bool = False
     ) -> List[str]:
@@ -2197,14 +2684,44 @@ class Toolkit(object):
 
         """
         if formatted:
-            formatted_elements = [
-                format_element(self.view.get_element(x)) for x in elements
-            ]
+            formatted_names = self._formatted_names
+            missing = [x for x in elements if x not in formatted_names]
+            if missing:
+                element_index = self._element_index
+                get_element = self.view.get_element
+                for x in missing:
+                    formatted_names[x] = format_element(element_index.get(x) or get_element(x))
+            formatted_elements = [formatted_names[x] for x in elements]
         else:
             formatted_elements = elements
         return formatted_elements
 
-    @lru_cache(CACHE_SIZE)
+    @cached_property
+    def _formatted_names(self) -> Dict[str, str]:
+        """
+        CURIEs of the element names formatted so far, shared by all lookups.
+        """
+        return {}
+
+    def clear_caches(self) -> None:
+        """
+        Clear all memoized lookups and precomputed indices of the toolkit,
+        e.g. after the underlying SchemaView has been modified.
+
+        The memoized methods keep a single cache per class, shared by all
+        toolkits, so calling this on one toolkit clears them for every
+        instance. The name parsing cache of ``bmt.utils`` and the predicate
+        mapping (``pmap``) are not derived from the SchemaView and are left
+        untouched.
+
+        """
+        for cls in type(self).__mro__:
+            for attribute in vars(cls).values():
+                if hasattr(attribute, "cache_clear"):
+                    attribute.cache_clear()
+                elif isinstance(attribute, cached_property):
+                    self.__dict__.pop(attribute.attrname, None)
+
     def get_model_version(self) -> str:
         """
         Return the version of the biolink-model in use.
@@ -2217,7 +2734,7 @@ class Toolkit(object):
         """
         return self.view.schema.version
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.3.0",
         removed_in="1.0",
         details="Use get_all_elements method instead",
@@ -2225,7 +2742,7 @@ class Toolkit(object):
     def names(self, formatted: bool = False) -> List[str]:
         return self.get_all_elements(formatted)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.2.0",
         removed_in="1.0",
         details="Use get_descendants method instead",
@@ -2233,7 +2750,7 @@ class Toolkit(object):
     def descendents(self, name: str, mixin: bool = True) -> List[str]:
         return self.get_descendants(name, mixin)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.2.0",
         removed_in="1.0",
         details="Use get_ancestors method instead",
@@ -2241,7 +2758,7 @@ class Toolkit(object):
     def ancestors(self, name: str, mixin: bool = True) -> List[str]:
         return self.get_ancestors(name, mixin)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.2.0",
         removed_in="1.0",
         details="Use get_children method instead",
@@ -2249,13 +2766,13 @@ class Toolkit(object):
     def children(self, name: str, mixin: bool = True) -> List[str]:
         return self.get_children(name, mixin)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.2.0", removed_in="1.0", details="Use get_parent method instead"
     )
     def parent(self, name: str, mixin: bool = True) -> Optional[str]:
         return self.get_parent(name, mixin)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.1.1",
         removed_in="1.0",
         details="Use is_predicate method instead",
@@ -2263,7 +2780,7 @@ class Toolkit(object):
     def is_edgelabel(self, name: str, mixin: bool = True) -> bool:
         return self.is_predicate(name, mixin)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.1.1",
         removed_in="1.0",
         details="Use get_all_elements_by_mapping method instead",
@@ -2271,7 +2788,7 @@ class Toolkit(object):
     def get_all_by_mapping(self, uriorcurie: str) -> List[str]:
         return self.get_all_elements_by_mapping(uriorcurie)
 
-    @deprecation.deprecated(
+    @_deprecated(
         deprecated_in="0.1.1",
         removed_in="1.0",
         details="Use get_element_by_mapping method instead",
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 import stringcase
 from linkml_runtime.linkml_model.meta import (
@@ -123,6 +124,7 @@ def format_element(element: Element) -> str:
     return formatted
 
 
+@lru_cache(maxsize=4096)
 def parse_name(name) -> str:
     """
     Parse an element name into it's proper internal representation.
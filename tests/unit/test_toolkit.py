@@ -1,10 +1,12 @@
+import warnings
 from typing import Optional, List
 
 import pytest
 from linkml_runtime.linkml_model import Element
+from linkml_runtime.linkml_model.meta import ClassDefinition, SchemaDefinition, SlotDefinition
 
 from bmt import Toolkit
-from bmt.toolkit import LATEST_BIOLINK_RELEASE
+from bmt.toolkit import LATEST_BIOLINK_RELEASE, _deprecated
 
 
 @pytest.fixture(scope="module")
@@ -87,6 +89,29 @@ def test_get_model_version(toolkit):
     assert version == LATEST_BIOLINK_RELEASE
 
 
+def test_clear_caches(toolkit):
+    ancestors = toolkit.get_ancestors(GENE)
+    assert toolkit.is_category(GENE)
+    toolkit.clear_caches()
+    assert Toolkit.get_element.cache_info().currsize == 0
+    assert Toolkit.get_ancestors.cache_info().currsize == 0
+    assert "_element_index" not in vars(toolkit)
+    assert "_ancestors_memo" not in vars(toolkit)
+    assert toolkit.get_ancestors(GENE) == ancestors
+    assert toolkit.is_category(GENE)
+
+
+def test_clear_caches_of_subclass(toolkit):
+    class SubToolkit(Toolkit):
+        pass
+
+    sub_toolkit = SubToolkit(toolkit.view.schema, warm=False)
+    assert sub_toolkit.get_element(GENE)
+    sub_toolkit.clear_caches()
+    assert Toolkit.get_element.cache_info().currsize == 0
+    assert "_element_index" not in vars(sub_toolkit)
+
+
 def test_sv(toolkit):
     v = toolkit.view
     ancs = v.slot_ancestors('broad match')
@@ -123,6 +148,15 @@ def test_mixin_validate_edge(toolkit):
     assert toolkit.validate_edge(subject, predicate, p_object, ancestors=True)
 
 
+def test_mixin_validate_edge_keeps_ancestors(toolkit):
+    # mixins are validated as if they descended from NamedThing, without
+    # adding NamedThing to the (cached) ancestors of the mixin
+    assert toolkit.validate_edge(GENE_OR_GENE_PRODUCT_CURIE, BIOLINK_RELATED_TO, GENE_CURIE)
+    assert toolkit.validate_edge(GENE_OR_GENE_PRODUCT_CURIE, BIOLINK_RELATED_TO, GENE_CURIE)
+    ancestors = toolkit.get_ancestors(GENE_OR_GENE_PRODUCT, formatted=True, mixin=True)
+    assert BIOLINK_NAMED_THING not in ancestors
+
+
 def test_not_valid_edge(toolkit):
     subject = NAMED_THING_CURIE
     predicate = "biolink:has_target"
@@ -145,6 +179,14 @@ def test_predicate_map(toolkit):
     assert mp.get("biolink:object_aspect_qualifier") == 'activity or abundance'
 
 
+def test_predicate_map_reassigned(toolkit):
+    tk = Toolkit(toolkit.view.schema, warm=False)
+    tk.pmap = {"predicate mappings": [{"mapped predicate": "augments", "object aspect qualifier": "activity"}]}
+    assert tk.get_predicate_mapping("augments").get("biolink:object_aspect_qualifier") == "activity"
+    tk.pmap = {"predicate mappings": [{"mapped predicate": "augments", "object aspect qualifier": "abundance"}]}
+    assert tk.get_predicate_mapping("augments").get("biolink:object_aspect_qualifier") == "abundance"
+
+
 def test_rna(toolkit):
     assert 'molecular entity' in toolkit.get_descendants(ENTITY_CURIE)
     assert 'microRNA' in toolkit.get_descendants(ENTITY_CURIE)
@@ -155,6 +197,15 @@ def test_get_element_by_mapping(toolkit):
     element_name = toolkit.get_element_by_mapping("RO:0003303")
     assert element_name == "causes"
 
+    # only declared as a related mapping of 'in pathway with'
+    assert not toolkit.get_element_by_exact_mapping("SIO:010532")
+    assert not toolkit.get_element_by_close_mapping("SIO:010532")
+    assert "in pathway with" in toolkit.get_element_by_related_mapping("SIO:010532")
+    assert toolkit.get_element_by_mapping("SIO:010532", most_specific=True) == "in pathway with"
+    assert toolkit.get_element_by_mapping(
+        "SIO:010532", most_specific=True, formatted=True
+    ) == "biolink:in_pathway_with"
+
 
 def test_get_element_by_prefix(toolkit):
     elements = toolkit.get_element_by_prefix("UBERON:1234")
@@ -620,6 +671,20 @@ def test_get_associations_with_parameters(
     assert not any([entry in associations for entry in does_not_contain])
 
 
+def test_get_associations_inverse_with_unformatted_categories(toolkit):
+    # same query as Q6 above, but with plain element names: the inverse
+    # match must use the normalized categories, not the names as given
+    associations = toolkit.get_associations(
+        subject_categories=[GENE],
+        predicates=["affected by"],
+        object_categories=["small molecule"],
+        match_inverses=True,
+        formatted=True
+    )
+    assert "biolink:ChemicalAffectsGeneAssociation" in associations
+    assert "biolink:Association" not in associations
+
+
 def test_get_associations_gene_to_chemical(toolkit):
     associations = toolkit.get_associations(
         subject_categories=["biolink:ChemicalEntity"],
@@ -722,6 +787,21 @@ def test_is_predicate(toolkit):
     assert not toolkit.is_category(HAS_POPULATION_CONTEXT)
 
 
+def test_is_a_checks_without_mixins(toolkit):
+    # the root elements are reflexively their own ancestors
+    assert toolkit.is_predicate(RELATED_TO, mixin=False)
+    assert toolkit.is_category(NAMED_THING, mixin=False)
+    assert toolkit.is_node_property(NODE_PROPERTY, mixin=False)
+    assert toolkit.is_association_slot(ASSOCIATION_SLOT, mixin=False)
+
+    # mixin ancestors are only followed when asked for
+    assert GENE_OR_GENE_PRODUCT in toolkit.get_ancestors(GENE)
+    assert GENE_OR_GENE_PRODUCT not in toolkit.get_ancestors(GENE, mixin=False)
+    assert toolkit.is_category(GENE, mixin=False)
+    assert toolkit.is_mixin(GENE_OR_GENE_PRODUCT)
+    assert not toolkit.is_category(GENE_OR_GENE_PRODUCT, mixin=False)
+
+
 def test_is_mixin(toolkit):
     assert not toolkit.is_mixin(NAMED_THING)
     assert toolkit.is_mixin("ontology class")
@@ -762,6 +842,14 @@ def test_get_get_inverse_predicate(toolkit):
     assert toolkit.get_inverse_predicate(RELATED_TO, formatted=True) == BIOLINK_RELATED_TO
 
 
+def test_in_subset(toolkit):
+    assert toolkit.in_subset(GENE, "model_organism_database")
+    assert toolkit.in_subset(GENE_CURIE, "model_organism_database")
+    assert not toolkit.in_subset(NAMED_THING, "model_organism_database")
+    assert not toolkit.in_subset("this_does_not_exist", "translator_minimal")
+    assert not toolkit.in_subset(GENE, "this_subset_does_not_exist")
+
+
 def test_category(toolkit):
     assert toolkit.is_category(NAMED_THING)
     assert toolkit.is_category(GENE)
@@ -937,6 +1025,14 @@ def test_ancestors(toolkit):
     assert GENE not in toolkit.get_ancestors(CHEMICAL_ENTITY_CURIE, reflexive=False)
 
 
+def test_iter_ancestors(toolkit):
+    assert RELATED_TO in toolkit.iter_ancestors(CAUSES)
+    assert CAUSES not in toolkit.iter_ancestors(CAUSES, reflexive=False)
+    assert GENE_OR_GENE_PRODUCT not in toolkit.iter_ancestors(GENE, mixin=False)
+    assert set(toolkit.iter_ancestors(GENE)) == set(toolkit.get_ancestors(GENE))
+    assert list(toolkit.iter_ancestors("this_does_not_exist")) == []
+
+
 def test_permissible_value_ancestors(toolkit):
     assert "increased" in toolkit.get_permissible_value_ancestors("upregulated", "DirectionQualifierEnum")
     assert "modified_form" in toolkit.get_permissible_value_ancestors(
@@ -988,6 +1084,13 @@ def test_descendants(toolkit):
     assert GENE in toolkit.get_descendants(GENE, reflexive=True)
 
 
+def test_iter_descendants(toolkit):
+    assert GENE in toolkit.iter_descendants(GENE_OR_GENE_PRODUCT)
+    assert GENE not in toolkit.iter_descendants(GENE_OR_GENE_PRODUCT, mixin=False)
+    assert CAUSES in toolkit.iter_descendants(RELATED_TO)
+    assert set(toolkit.iter_descendants(NAMED_THING)) == set(toolkit.get_descendants(NAMED_THING))
+
+
 def test_children(toolkit):
     assert CAUSES in toolkit.get_children("contributes to")
     assert "physically interacts with" in toolkit.get_children(INTERACTS_WITH)
@@ -1006,9 +1109,53 @@ def test_parent(toolkit):
     assert BIOLINK_BIOLOGICAL_ENTITY in toolkit.get_parent(GENE, formatted=True)
 
 
+def test_deprecated_hierarchy_methods(toolkit):
+    # the deprecated methods keep their historical output, which passes
+    # mixin on as the next positional argument of the methods they wrap
+    assert toolkit.parent(GENE) == BIOLINK_BIOLOGICAL_ENTITY
+    assert "biolink:causes" in toolkit.children("contributes to")
+    assert GENE in toolkit.ancestors(GENE)
+    assert GENE not in toolkit.ancestors(GENE, mixin=False)
+
+
+def test_deprecated_docstring():
+    assert ".. deprecated:: 0.3.0" in Toolkit.names.__doc__
+    assert "Use get_all_elements method instead" in Toolkit.names.__doc__
+
+
+def test_deprecated_warns_once():
+    @_deprecated(deprecated_in="0.1.0", removed_in="1.0", details="Use new_function instead")
+    def old_function():
+        return 1
+
+    with pytest.warns(DeprecationWarning):
+        assert old_function() == 1
+    # later calls are silent, even with warnings turned into errors
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert old_function() == 1
+
+
+def test_deprecated_warns_again_after_error():
+    @_deprecated(deprecated_in="0.1.0", removed_in="1.0")
+    def old_function():
+        return 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(DeprecationWarning):
+            old_function()
+    # the warning that raised does not count as issued
+    with pytest.warns(DeprecationWarning):
+        assert old_function() == 1
+
+
 def test_mapping(toolkit):
     assert len(toolkit.get_all_elements_by_mapping("SO:0000704")) == 1
     assert GENE in toolkit.get_all_elements_by_mapping("SO:0000704")
+    assert GENE in toolkit.get_element_by_exact_mapping("SO:0000704")
+    assert GENE_CURIE in toolkit.get_element_by_exact_mapping("SO:0000704", formatted=True)
+    assert GENE not in toolkit.get_element_by_broad_mapping("SO:0000704")
 
     assert len(toolkit.get_all_elements_by_mapping("MONDO:0000001")) == 1
     assert "disease" in toolkit.get_all_elements_by_mapping("MONDO:0000001")
@@ -1051,6 +1198,35 @@ def test_get_slot_domain(toolkit):
     assert ASSOCIATION in toolkit.get_slot_domain("predicate")
 
 
+def test_get_slot_domain_with_several_domains():
+    # a slot without a domain of its own, inheriting one domain from its
+    # is_a parent and another from its mixin
+    schema = SchemaDefinition(
+        id="https://w3id.org/biolink/test",
+        name="test",
+        default_prefix="biolink",
+        classes=[
+            ClassDefinition("first domain"),
+            ClassDefinition("first domain child", is_a="first domain"),
+            ClassDefinition("second domain"),
+            ClassDefinition("second domain child", is_a="second domain"),
+        ],
+        slots=[
+            SlotDefinition("first slot", domain="first domain"),
+            SlotDefinition("second slot", domain="second domain", mixin=True),
+            SlotDefinition("combined slot", is_a="first slot", mixins=["second slot"]),
+        ],
+    )
+    tk = Toolkit(schema, warm=False)
+    # the descendants of every domain are included, each only once; before,
+    # only the descendants of the last domain were added, alongside duplicates
+    domain = tk.get_slot_domain("combined slot", include_ancestors=True)
+    assert len(domain) == len(set(domain))
+    assert sorted(domain) == [
+        "first domain", "first domain child", "second domain", "second domain child"
+    ]
+
+
 def test_get_slot_range(toolkit):
     assert "disease or phenotypic feature" in toolkit.get_slot_range("treats")
     assert "disease" in toolkit.get_slot_range("treats", include_ancestors=True)
@@ -1159,6 +1335,13 @@ def test_get_value_type_for_slot(toolkit):
     )
 
 
+def test_get_value_type_for_slot_keeps_slot_range(toolkit):
+    # 'symbol' declares no range; the schema default range is only a fallback
+    assert toolkit.get_element("symbol").range is None
+    assert toolkit.get_value_type_for_slot("symbol") == "string"
+    assert toolkit.get_element("symbol").range is None
+
+
 def test_get_all_types(toolkit):
     basic_descendants = {}
 